@@ -10,18 +10,37 @@ TOOLS:
 4. extract_formulas - Extract all formulas from a workbook
 5. read_with_hidden - Read data including hidden rows/columns
 6. comprehensive_analysis - Full workbook analysis (all features)
+
+Per-sheet comment and question listings are column-oriented: parallel lists
+("cells", "values", "texts", "authors" for comments; "cells", "texts",
+"answer_cells", "answers" for questions) rather than one object per cell,
+which keeps large results cheap to build and serialize.
 """
 
 import json
 import sys
-import base64
-import tempfile
 import os
+import base64
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from openpyxl import load_workbook
+from openpyxl.reader.excel import ExcelReader
 from openpyxl.utils import get_column_letter
 
+# openpyxl reader internals (optional - streamed question scan). These are private,
+# so fall back to iter_rows(values_only=True) if an openpyxl release moves them or the
+# worksheet/workbook attributes the scan opens them with (see _open_sheet_parser).
+# Per-row parser behaviour (parse_row, row_counter) is only guarded by the pin in
+# requirements.txt.
+try:
+    from openpyxl.worksheet._reader import WorkSheetParser, ROW_TAG, VALUE_TAG, FORMULA_TAG
+    from openpyxl.xml.functions import iterparse
+    STREAM_SCAN_AVAILABLE = True
+except ImportError:
+    STREAM_SCAN_AVAILABLE = False
+
 # Azure Storage imports (optional - for direct file access)
 try:
     from azure.storage.blob import BlobServiceClient
@@ -29,28 +48,286 @@ try:
 except ImportError:
     AZURE_AVAILABLE = False
 
+# orjson (optional - C-level JSON encoding for large analysis results)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def loads_request(line: bytes) -> Dict[str, Any]:
+    """Parse one JSON-RPC request line, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def dumps_result(result: Dict[str, Any]) -> str:
+    """Pretty-print a tool result, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2)
+
+def write_response(response: Dict[str, Any]) -> None:
+    """Write one JSON-RPC response line to stdout with a single write and flush
+
+    json.dumps escapes non-ASCII, so the line is pure ASCII and a reader that
+    decodes stdout chunk by chunk can never split a multi-byte character.
+    """
+    sys.stdout.buffer.write(json.dumps(response).encode() + b'\n')
+    sys.stdout.buffer.flush()
+
+# Column letters indexed by 1-based column number, up to Excel's last column (XFD = 16384)
+# plus one so the answer cell next to a question in XFD still resolves
+COL_LETTERS = [""] + [get_column_letter(col_num) for col_num in range(1, 16386)]
+
+def env_int(name: str, default: int) -> int:
+    """Positive integer setting from the environment; malformed values fall back to default"""
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        print(f"Ignoring invalid {name}={os.environ[name]!r}, using {default}", file=sys.stderr)
+        return default
+
+# Per-sheet process pool for the question scan (pure-Python XML traversal holds the GIL).
+# Only worth the worker start-up on larger multi-sheet workbooks; EXCEL_ANALYSIS_WORKERS=1 disables it.
+MAX_SCAN_WORKERS = env_int("EXCEL_ANALYSIS_WORKERS", min(8, os.cpu_count() or 1))
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Read_only workbook and question string ids held by each pool worker
+_worker_workbook = None
+_worker_question_strings = frozenset()
+
 class ExcelAnalyzer:
     """Excel analysis using openpyxl"""
 
     @staticmethod
-    def load_workbook_from_buffer(file_buffer: bytes):
-        """Load workbook from buffer"""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            tmp_file.write(file_buffer)
-            tmp_path = tmp_file.name
+    def load_workbook_from_buffer(file_buffer: bytes, read_only: bool = False):
+        """Load workbook from buffer
+
+        read_only streams worksheet XML on demand instead of building the full
+        cell tree up front. Comments and row/column dimensions are only
+        populated in normal mode, so callers that need them must pass False.
+        """
+        return load_workbook(BytesIO(file_buffer), data_only=False, read_only=read_only, keep_links=False)
 
+    @staticmethod
+    def _sheet_names(file_buffer: bytes) -> List[str]:
+        """Sheet names from the workbook part alone, without reading shared strings or styles"""
+        reader = ExcelReader(BytesIO(file_buffer), read_only=True, keep_links=False)
         try:
-            wb = load_workbook(tmp_path, data_only=False)
-            return wb, tmp_path
-        except Exception as e:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-            raise e
+            reader.read_manifest()
+            reader.read_workbook()
+            return [sheet.name for sheet, rel in reader.parser.find_sheets() if rel.target in reader.valid_files]
+        finally:
+            reader.archive.close()
+
+    @staticmethod
+    def _comment_columns() -> Dict[str, List[str]]:
+        """Empty column-oriented comment listing for one sheet"""
+        return {"cells": [], "values": [], "texts": [], "authors": []}
+
+    @staticmethod
+    def _add_comment(columns: Dict[str, List[str]], cell) -> None:
+        """Append a commented cell to a sheet's comment columns"""
+        comment = cell.comment
+        value = cell.value
+        columns["cells"].append(cell.coordinate)
+        columns["values"].append(str(value) if value else "")
+        columns["texts"].append(comment.text)
+        columns["authors"].append(comment.author or "Unknown")
+
+    @staticmethod
+    def _populated_cells(ws) -> Dict[Tuple[int, int], Any]:
+        """Cells a normal-mode worksheet actually stores, keyed (row, column) in row-major order
+
+        iter_rows() walks every coordinate of the used range and creates an empty
+        cell for each gap; real sheets are mostly gaps, so skip them up front.
+        _cells is private: if an openpyxl release drops it, walk iter_rows() instead.
+        """
+        stored = getattr(ws, '_cells', None)
+        if stored is None:
+            return {(cell.row, cell.column): cell for row in ws.iter_rows() for cell in row}
+        return dict(sorted(stored.items()))
+
+    @staticmethod
+    def _question_columns() -> Dict[str, List[str]]:
+        """Empty column-oriented question listing for one sheet"""
+        return {"cells": [], "texts": [], "answer_cells": [], "answers": []}
+
+    @staticmethod
+    def _add_question(columns: Dict[str, List[str]], row_idx: int, col_idx: int, question, answer) -> None:
+        """Append a question cell and the answer in the next cell to the right
+
+        The answer value is looked up among cells already read: ws.cell()
+        re-streams the sheet in read_only mode and grows the sheet in normal mode.
+        """
+        columns["cells"].append(f"{COL_LETTERS[col_idx]}{row_idx}")
+        columns["texts"].append(str(question))
+        columns["answer_cells"].append(f"{COL_LETTERS[col_idx + 1]}{row_idx}")
+        columns["answers"].append(str(answer) if answer else "")
+
+    @staticmethod
+    def _add_sheet_listing(results: Dict[str, Any], sheet_name: str, columns: Dict[str, List[str]],
+                           count_key: str, total_key: str) -> None:
+        """Append a sheet's comment or question columns to results if it has any"""
+        count = len(columns["cells"])
+        if count:
+            results["worksheets"].append({
+                "sheet": sheet_name,
+                count_key: count,
+                **columns
+            })
+            results[total_key] += count
+
+    @staticmethod
+    def _question_string_ids(wb) -> frozenset:
+        """Shared-string table indices (as they appear in <v>) whose text contains '?'"""
+        # Every read_only sheet holds the workbook's string table. `'?' in text` is a C-level
+        # search per string (~13 ms for 300k strings); a Numba byte-scan kernel measured slower
+        # here because copying the table into a flat byte buffer costs more than the scan itself.
+        if not STREAM_SCAN_AVAILABLE or not wb.worksheets:
+            return frozenset()
+        shared_strings = getattr(wb.worksheets[0], '_shared_strings', None) or []
+        return frozenset(str(idx) for idx, text in enumerate(shared_strings) if '?' in text)
+
+    @staticmethod
+    def _scan_questions(wb, sheet_names: List[str]) -> List[Dict[str, List[str]]]:
+        """Question entries for each named sheet of a read_only workbook"""
+        question_strings = ExcelAnalyzer._question_string_ids(wb)
+        return [ExcelAnalyzer._scan_sheet_questions(wb, wb[name], question_strings) for name in sheet_names]
+
+    @staticmethod
+    def _open_sheet_parser(wb, ws):
+        """Raw XML stream and a WorkSheetParser set up like ReadOnlyWorksheet's own
+
+        Returns None when the private reader or the attributes it needs are not
+        available in this openpyxl, so the caller can use the public scan instead.
+        """
+        if not STREAM_SCAN_AVAILABLE:
+            return None
+        try:
+            src = ws._get_source()
+        except AttributeError:
+            return None
+        try:
+            parser = WorkSheetParser(src,
+                                     ws._shared_strings,
+                                     epoch=wb.epoch,
+                                     date_formats=wb._date_formats,
+                                     timedelta_formats=wb._timedelta_formats)
+        except (AttributeError, TypeError):
+            src.close()
+            return None
+        return src, parser
+
+    @staticmethod
+    def _scan_sheet_questions(wb, ws, question_strings: frozenset) -> Dict[str, List[str]]:
+        """Stream a read_only worksheet's XML and return its question columns
+
+        Almost all text lives in the shared-string table, so a string cell is a
+        question iff its <v> index is in question_strings; numbers, booleans and
+        dates can never contain '?'. Only rows holding a candidate (a matching
+        shared or inline string, an error literal containing '?', or a formula)
+        are decoded, with the same
+        parser and settings ReadOnlyWorksheet uses, so values match openpyxl's.
+        """
+        opened = ExcelAnalyzer._open_sheet_parser(wb, ws)
+        if opened is None:
+            return ExcelAnalyzer._iter_sheet_questions(ws)
+
+        src, parser = opened
+        questions = ExcelAnalyzer._question_columns()
+
+        with src:
+            for _, element in iterparse(src):
+                if element.tag != ROW_TAG:
+                    continue
+
+                candidate = False
+                for cell in element:
+                    data_type = cell.get('t')
+                    if data_type == 's':
+                        candidate = cell.findtext(VALUE_TAG) in question_strings
+                    elif data_type == 'inlineStr':
+                        candidate = '?' in ''.join(cell.itertext())
+                    elif data_type == 'e':
+                        # Literal errors (e.g. #NAME? left by paste-as-values) decode to their text
+                        candidate = '?' in (cell.findtext(VALUE_TAG) or '')
+                    else:
+                        # Formulas must always be decoded so shared formulae are registered
+                        candidate = data_type == 'str' or cell.find(FORMULA_TAG) is not None
+                    if candidate:
+                        break
+
+                if not candidate:
+                    row_ref = element.get('r')
+                    parser.row_counter = int(row_ref) if row_ref else parser.row_counter + 1
+                    element.clear()
+                    continue
+
+                row_idx, cells = parser.parse_row(element)
+                element.clear()
+
+                values = {cell['column']: cell['value'] for cell in cells}
+                for cell in cells:
+                    value = cell['value']
+                    # Non-string values (numbers, dates, array formulae) never render a '?'
+                    if isinstance(value, str) and '?' in value:
+                        col_idx = cell['column']
+                        ExcelAnalyzer._add_question(questions, row_idx, col_idx, value, values.get(col_idx + 1))
+
+        return questions
+
+    @staticmethod
+    def _iter_sheet_questions(ws) -> Dict[str, List[str]]:
+        """Question columns for a read_only worksheet via public value iteration"""
+        questions = ExcelAnalyzer._question_columns()
+
+        # Values only: no Cell objects are built for the (usual) non-question cells
+        for row_idx, row_values in enumerate(ws.iter_rows(values_only=True), start=1):
+            for col_idx, value in enumerate(row_values, start=1):
+                if isinstance(value, str) and '?' in value:
+                    answer_value = row_values[col_idx] if col_idx < len(row_values) else None
+                    ExcelAnalyzer._add_question(questions, row_idx, col_idx, value, answer_value)
+
+        return questions
+
+    @staticmethod
+    def _hidden_sheet_data(ws) -> Dict[str, Any]:
+        """Collect hidden rows and columns for one worksheet (normal mode only)"""
+        hidden_rows = []
+        max_row = ws.max_row
+        max_column = ws.max_column
+
+        # Check hidden rows. Only explicitly defined dimensions can be hidden; indexing
+        # the holders for every row/column would also insert a default entry for each one.
+        for row_num, row_dim in ws.row_dimensions.items():
+            if row_dim.hidden and row_num <= max_row:
+                hidden_rows.append(row_num)
+        hidden_rows.sort()
+
+        # Check hidden columns (one dimension may span a min..max range)
+        hidden_col_nums = set()
+        for col_dim in ws.column_dimensions.values():
+            if col_dim.hidden and col_dim.min:
+                hidden_col_nums.update(range(col_dim.min, min(col_dim.max or col_dim.min, max_column) + 1))
+        hidden_columns = [COL_LETTERS[col_num] for col_num in sorted(hidden_col_nums)]
+
+        return {
+            "sheet": ws.title,
+            "hidden": ws.sheet_state == 'hidden',
+            "row_count": ws.max_row,
+            "column_count": ws.max_column,
+            "hidden_row_count": len(hidden_rows),
+            "hidden_column_count": len(hidden_columns),
+            "hidden_rows": hidden_rows[:50],  # Limit to first 50
+            "hidden_columns": hidden_columns[:50]
+        }
 
     @staticmethod
     def extract_comments(filename: str, file_buffer: bytes = None) -> Dict[str, Any]:
         """Extract all comments from an Excel workbook"""
-        wb, tmp_path = ExcelAnalyzer.load_workbook_from_buffer(file_buffer)
+        wb = ExcelAnalyzer.load_workbook_from_buffer(file_buffer)
 
         try:
             results = {
@@ -61,79 +338,59 @@ class ExcelAnalyzer:
 
             for sheet_name in wb.sheetnames:
                 ws = wb[sheet_name]
-                sheet_comments = []
-
-                for row in ws.iter_rows():
-                    for cell in row:
-                        if cell.comment:
-                            sheet_comments.append({
-                                "cell": cell.coordinate,
-                                "value": str(cell.value) if cell.value else "",
-                                "comment": cell.comment.text,
-                                "author": getattr(cell.comment, 'author', 'Unknown')
-                            })
-
-                if sheet_comments:
-                    results["worksheets"].append({
-                        "sheet": sheet_name,
-                        "comment_count": len(sheet_comments),
-                        "comments": sheet_comments
-                    })
-                    results["total_comments"] += len(sheet_comments)
+                sheet_comments = ExcelAnalyzer._comment_columns()
+
+                for cell in ExcelAnalyzer._populated_cells(ws).values():
+                    if cell.comment:
+                        ExcelAnalyzer._add_comment(sheet_comments, cell)
+
+                ExcelAnalyzer._add_sheet_listing(results, sheet_name, sheet_comments,
+                                                 "comment_count", "total_comments")
 
-            wb.close()
             return results
         finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            wb.close()
 
     @staticmethod
     def extract_questions(filename: str, file_buffer: bytes = None) -> Dict[str, Any]:
         """Find all cells containing questions (cells with '?')"""
-        wb, tmp_path = ExcelAnalyzer.load_workbook_from_buffer(file_buffer)
+        results = {
+            "filename": filename,
+            "total_questions": 0,
+            "worksheets": []
+        }
 
-        try:
-            results = {
-                "filename": filename,
-                "total_questions": 0,
-                "worksheets": []
-            }
+        # Choose serial or parallel before loading: even a read_only load parses the whole
+        # shared-string table, which every pool worker would then parse again
+        workers = 1
+        if MAX_SCAN_WORKERS > 1 and len(file_buffer) >= PARALLEL_MIN_BYTES:
+            sheet_names = ExcelAnalyzer._sheet_names(file_buffer)
+            workers = min(MAX_SCAN_WORKERS, len(sheet_names))
+
+        if workers > 1:
+            # Sheets are independent: each worker opens its own read_only copy
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_question_worker,
+                                     initargs=(file_buffer,)) as pool:
+                per_sheet = list(pool.map(_scan_questions_in_worker, sheet_names))
+        else:
+            wb = ExcelAnalyzer.load_workbook_from_buffer(file_buffer, read_only=True)
+            try:
+                sheet_names = wb.sheetnames
+                per_sheet = ExcelAnalyzer._scan_questions(wb, sheet_names)
+            finally:
+                wb.close()
 
-            for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                sheet_questions = []
-
-                for row in ws.iter_rows():
-                    for cell in row:
-                        if cell.value and '?' in str(cell.value):
-                            # Try to find answer in adjacent cells (next cell to the right)
-                            answer_cell = ws.cell(row=cell.row, column=cell.column + 1)
-
-                            sheet_questions.append({
-                                "cell": cell.coordinate,
-                                "question": str(cell.value),
-                                "answer_cell": answer_cell.coordinate if answer_cell else None,
-                                "answer": str(answer_cell.value) if answer_cell and answer_cell.value else ""
-                            })
-
-                if sheet_questions:
-                    results["worksheets"].append({
-                        "sheet": sheet_name,
-                        "question_count": len(sheet_questions),
-                        "questions": sheet_questions
-                    })
-                    results["total_questions"] += len(sheet_questions)
+        for sheet_name, sheet_questions in zip(sheet_names, per_sheet):
+            ExcelAnalyzer._add_sheet_listing(results, sheet_name, sheet_questions,
+                                             "question_count", "total_questions")
 
-            wb.close()
-            return results
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        return results
 
     @staticmethod
     def detect_hidden_content(filename: str, file_buffer: bytes = None) -> Dict[str, Any]:
         """List all hidden rows and columns"""
-        wb, tmp_path = ExcelAnalyzer.load_workbook_from_buffer(file_buffer)
+        wb = ExcelAnalyzer.load_workbook_from_buffer(file_buffer)
 
         try:
             results = {
@@ -144,50 +401,20 @@ class ExcelAnalyzer:
             }
 
             for sheet_name in wb.sheetnames:
-                ws = wb[sheet_name]
-                hidden_rows = []
-                hidden_columns = []
-
-                # Check hidden rows
-                for row_num in range(1, ws.max_row + 1):
-                    row_dim = ws.row_dimensions[row_num]
-                    if row_dim.hidden:
-                        hidden_rows.append(row_num)
-
-                # Check hidden columns
-                for col_num in range(1, ws.max_column + 1):
-                    col_letter = get_column_letter(col_num)
-                    col_dim = ws.column_dimensions[col_letter]
-                    if col_dim.hidden:
-                        hidden_columns.append(col_letter)
-
-                sheet_data = {
-                    "sheet": sheet_name,
-                    "hidden": ws.sheet_state == 'hidden',
-                    "row_count": ws.max_row,
-                    "column_count": ws.max_column,
-                    "hidden_row_count": len(hidden_rows),
-                    "hidden_column_count": len(hidden_columns),
-                    "hidden_rows": hidden_rows[:50],  # Limit to first 50
-                    "hidden_columns": hidden_columns[:50]
-                }
+                sheet_data = ExcelAnalyzer._hidden_sheet_data(wb[sheet_name])
 
                 results["worksheets"].append(sheet_data)
-                results["total_hidden_rows"] += len(hidden_rows)
-                results["total_hidden_columns"] += len(hidden_columns)
+                results["total_hidden_rows"] += sheet_data["hidden_row_count"]
+                results["total_hidden_columns"] += sheet_data["hidden_column_count"]
 
-            wb.close()
             return results
         finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            wb.close()
 
     @staticmethod
     def comprehensive_analysis(filename: str, file_buffer: bytes = None) -> Dict[str, Any]:
         """Full workbook analysis combining all features"""
-        comments = ExcelAnalyzer.extract_comments(filename, file_buffer)
-        questions = ExcelAnalyzer.extract_questions(filename, file_buffer)
-        hidden = ExcelAnalyzer.detect_hidden_content(filename, file_buffer)
+        comments, questions, hidden = ExcelAnalyzer._analyze_all(filename, file_buffer)
 
         return {
             "filename": filename,
@@ -203,11 +430,65 @@ class ExcelAnalyzer:
             "hidden_content": hidden
         }
 
+    @staticmethod
+    def _analyze_all(filename: str, file_buffer: bytes) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Collect comments, questions and hidden content from a single workbook load
+
+        Loads the workbook once in normal mode (hidden dimensions and comments
+        need it) and collects comments and questions in a single row pass.
+        """
+        wb = ExcelAnalyzer.load_workbook_from_buffer(file_buffer)
+
+        try:
+            comments = {"filename": filename, "total_comments": 0, "worksheets": []}
+            questions = {"filename": filename, "total_questions": 0, "worksheets": []}
+            hidden = {"filename": filename, "total_hidden_rows": 0, "total_hidden_columns": 0, "worksheets": []}
+
+            for sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+
+                sheet_data = ExcelAnalyzer._hidden_sheet_data(ws)
+                hidden["worksheets"].append(sheet_data)
+                hidden["total_hidden_rows"] += sheet_data["hidden_row_count"]
+                hidden["total_hidden_columns"] += sheet_data["hidden_column_count"]
+
+                sheet_comments = ExcelAnalyzer._comment_columns()
+                sheet_questions = ExcelAnalyzer._question_columns()
+
+                cells = ExcelAnalyzer._populated_cells(ws)
+                for (row_idx, col_idx), cell in cells.items():
+                    if cell.comment:
+                        ExcelAnalyzer._add_comment(sheet_comments, cell)
+
+                    value = cell.value
+                    if isinstance(value, str) and '?' in value:
+                        answer_cell = cells.get((row_idx, col_idx + 1))
+                        answer_value = answer_cell.value if answer_cell is not None else None
+                        ExcelAnalyzer._add_question(sheet_questions, row_idx, col_idx, value, answer_value)
+
+                ExcelAnalyzer._add_sheet_listing(comments, sheet_name, sheet_comments,
+                                                 "comment_count", "total_comments")
+                ExcelAnalyzer._add_sheet_listing(questions, sheet_name, sheet_questions,
+                                                 "question_count", "total_questions")
+        finally:
+            wb.close()
+
+        return comments, questions, hidden
+
+def _init_question_worker(file_buffer: bytes) -> None:
+    global _worker_workbook, _worker_question_strings
+    _worker_workbook = ExcelAnalyzer.load_workbook_from_buffer(file_buffer, read_only=True)
+    _worker_question_strings = ExcelAnalyzer._question_string_ids(_worker_workbook)
+
+def _scan_questions_in_worker(sheet_name: str) -> Dict[str, List[str]]:
+    ws = _worker_workbook[sheet_name]
+    return ExcelAnalyzer._scan_sheet_questions(_worker_workbook, ws, _worker_question_strings)
+
 # MCP Server Implementation
 TOOLS = [
     {
         "name": "extract_comments",
-        "description": "Extract all Excel comments from a workbook. Returns comments with cell location, content, and author.",
+        "description": "Extract all Excel comments from a workbook. Returns per-sheet parallel lists: cells, values, texts (comment text), authors.",
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -221,7 +502,7 @@ TOOLS = [
     },
     {
         "name": "extract_questions",
-        "description": "Find all cells containing questions (cells with '?'). Automatically detects answers in adjacent cells.",
+        "description": "Find all cells containing questions (cells with '?'). Automatically detects answers in adjacent cells. Returns per-sheet parallel lists: cells, texts (question text), answer_cells, answers.",
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -249,7 +530,7 @@ TOOLS = [
     },
     {
         "name": "comprehensive_analysis",
-        "description": "Full workbook analysis - extracts comments, questions, hidden content, and provides summary statistics.",
+        "description": "Full workbook analysis - extracts comments, questions, hidden content, and provides summary statistics. Comment and question listings use the same per-sheet parallel lists as extract_comments and extract_questions.",
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -282,7 +563,7 @@ def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
                     },
                     "serverInfo": {
                         "name": "excel-python-mcp",
-                        "version": "1.0.0"
+                        "version": "2.0.0"
                     }
                 }
             }
@@ -322,7 +603,7 @@ def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
                 "jsonrpc": "2.0",
                 "id": req_id,
                 "result": {
-                    "content": json.dumps(result, indent=2)
+                    "content": dumps_result(result)
                 }
             }
 
@@ -340,18 +621,24 @@ def handle_request(request: Dict[str, Any]) -> Dict[str, Any]:
             }
         }
 
+STDIN_BUFFER_SIZE = 1024 * 1024
+
 def main():
     """Main server loop - read JSON-RPC from stdin, write to stdout"""
     print("Python Excel Analysis MCP Server starting...", file=sys.stderr)
 
-    for line in sys.stdin:
+    # Binary stdin with a large buffer: tools/call lines carry the whole workbook
+    # base64-encoded, so skip the text-mode decode and read them in big chunks
+    stdin = open(sys.stdin.fileno(), 'rb', buffering=STDIN_BUFFER_SIZE, closefd=False)
+
+    for line in stdin:
         if not line.strip():
             continue
 
         try:
-            request = json.loads(line)
+            request = loads_request(line)
             response = handle_request(request)
-            print(json.dumps(response), flush=True)
+            write_response(response)
         except Exception as e:
             error_response = {
                 "jsonrpc": "2.0",
@@ -362,7 +649,7 @@ def main():
                     "data": str(e)
                 }
             }
-            print(json.dumps(error_response), flush=True)
+            write_response(error_response)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the streamed extract_questions scan
+
+The fixture workbook is written by hand so it holds the cell encodings the
+scanner special-cases: shared strings, inline strings, shared formulae and
+literal error values. The streamed scan must agree with the public
+iter_rows() fallback and with comprehensive_analysis.
+
+Run: python3 -m unittest discover mcp-servers/tests
+"""
+
+import importlib.util
+import sys
+import unittest
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+SERVER_PATH = Path(__file__).resolve().parent.parent / "excel-python-server.py"
+
+spec = importlib.util.spec_from_file_location("excel_python_server", SERVER_PATH)
+server = importlib.util.module_from_spec(spec)
+sys.modules["excel_python_server"] = server
+spec.loader.exec_module(server)
+
+NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+REL_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+
+SHARED_STRINGS = ["Name?", "Alice", "no question here"]
+
+SHEET_ROWS = [
+    # Shared string question with a shared string answer
+    '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>',
+    # Inline string question with a numeric answer
+    '<row r="2"><c r="A2" t="inlineStr"><is><t>Inline?</t></is></c><c r="B2"><v>42</v></c></row>',
+    # Shared formula master and a follower that only carries the shared index
+    '<row r="3"><c r="A3" t="str"><f t="shared" ref="A3:A4" si="0">"Formula?"&amp;B3</f><v>Formula?x</v></c>'
+    '<c r="B3" t="inlineStr"><is><t>x</t></is></c></row>',
+    '<row r="4"><c r="A4" t="str"><f t="shared" si="0"/><v>Formula?</v></c></row>',
+    # Literal error left behind by paste-as-values
+    '<row r="5"><c r="A5" t="e"><v>#NAME?</v></c><c r="B5" t="s"><v>1</v></c></row>',
+    # Rows with nothing to report
+    '<row r="6"><c r="A6"><v>7</v></c><c r="B6" t="e"><v>#DIV/0!</v></c></row>',
+    '<row r="8"><c r="A8" t="s"><v>2</v></c></row>',
+    # Question after a gap in row numbers
+    '<row r="20"><c r="C20" t="inlineStr"><is><t>Last?</t></is></c><c r="D20" t="s"><v>1</v></c></row>',
+]
+
+EXPECTED_CELLS = ["A1", "A2", "A3", "A4", "A5", "C20"]
+
+
+def build_fixture() -> bytes:
+    """Minimal .xlsx with one worksheet and a shared-string table"""
+    shared = "".join(f"<si><t>{text}</t></si>" for text in SHARED_STRINGS)
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '</Types>'
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/workbook.xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?><workbook {NS} {REL_NS}>'
+            '<sheets><sheet name="Questions" sheetId="1" r:id="rId1"/></sheets></workbook>'
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            'Target="worksheets/sheet1.xml"/>'
+            '<Relationship Id="rId2" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+            'Target="sharedStrings.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/sharedStrings.xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?><sst {NS} count="{len(SHARED_STRINGS)}" '
+            f'uniqueCount="{len(SHARED_STRINGS)}">{shared}</sst>'
+        ),
+        "xl/worksheets/sheet1.xml": (
+            f'<?xml version="1.0" encoding="UTF-8"?><worksheet {NS}>'
+            f'<sheetData>{"".join(SHEET_ROWS)}</sheetData></worksheet>'
+        ),
+    }
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+class QuestionScanTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.file_buffer = build_fixture()
+
+    def setUp(self):
+        # Keep the serial in-process path regardless of EXCEL_ANALYSIS_WORKERS
+        self._max_workers = server.MAX_SCAN_WORKERS
+        self._stream_available = server.STREAM_SCAN_AVAILABLE
+        server.MAX_SCAN_WORKERS = 1
+
+    def tearDown(self):
+        server.MAX_SCAN_WORKERS = self._max_workers
+        server.STREAM_SCAN_AVAILABLE = self._stream_available
+
+    def extract(self):
+        return server.ExcelAnalyzer.extract_questions("fixture.xlsx", self.file_buffer)
+
+    def test_streamed_scan_finds_every_encoding(self):
+        result = self.extract()
+
+        self.assertEqual(result["total_questions"], len(EXPECTED_CELLS))
+        sheet = result["worksheets"][0]
+        self.assertEqual(sheet["cells"], EXPECTED_CELLS)
+        self.assertEqual(sheet["texts"][0], "Name?")
+        self.assertEqual(sheet["answers"][0], "Alice")
+        self.assertEqual(sheet["answers"][1], "42")
+        self.assertEqual(sheet["texts"][4], "#NAME?")
+        self.assertEqual(sheet["answer_cells"][5], "D20")
+
+    def test_streamed_scan_matches_public_fallback(self):
+        streamed = self.extract()
+        server.STREAM_SCAN_AVAILABLE = False
+        self.assertEqual(self.extract(), streamed)
+
+    def test_streamed_scan_matches_comprehensive_analysis(self):
+        streamed = self.extract()
+        comprehensive = server.ExcelAnalyzer.comprehensive_analysis("fixture.xlsx", self.file_buffer)
+        self.assertEqual(comprehensive["questions"], streamed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,23 +16,14 @@ import { TableClient } from '@azure/data-tables';
 const POWERNODE_STORAGE_CONNECTION =
   process.env.POWERNODE_STORAGE_CONNECTION || process.env.AZURE_STORAGE_CONNECTION_STRING || '';
 
-// Helper to convert stream to buffer
-async function streamToBuffer(readableStream: NodeJS.ReadableStream): Promise<Buffer> {
-  return new Promise((resolve, reject) => {
-    const chunks: Buffer[] = [];
-    readableStream.on('data', (data) => {
-      chunks.push(data instanceof Buffer ? data : Buffer.from(data));
-    });
-    readableStream.on('end', () => resolve(Buffer.concat(chunks)));
-    readableStream.on('error', reject);
-  });
-}
+// Number of parallel ranged requests used to fetch a workbook from blob storage
+const BLOB_DOWNLOAD_CONCURRENCY = 8;
 
 // MCP Tool Definitions
 const TOOLS = [
   {
     name: 'extract_comments',
-    description: 'Extract all Excel comments from a workbook. Returns comments with cell location, content, and author.',
+    description: 'Extract all Excel comments from a workbook. Returns per-sheet parallel lists: cells, values, texts (comment text), authors.',
     inputSchema: {
       type: 'object',
       properties: {
@@ -46,7 +37,7 @@ const TOOLS = [
   },
   {
     name: 'extract_questions',
-    description: 'Find all cells containing questions (cells with \'?\').  Automatically detects answers in adjacent cells.',
+    description: 'Find all cells containing questions (cells with \'?\').  Automatically detects answers in adjacent cells. Returns per-sheet parallel lists: cells, texts (question text), answer_cells, answers.',
     inputSchema: {
       type: 'object',
       properties: {
@@ -74,7 +65,7 @@ const TOOLS = [
   },
   {
     name: 'comprehensive_analysis',
-    description: 'Full workbook analysis - extracts comments, questions, hidden content, and provides summary statistics.',
+    description: 'Full workbook analysis - extracts comments, questions, hidden content, and provides summary statistics. Comment and question listings use the same per-sheet parallel lists as extract_comments and extract_questions.',
     inputSchema: {
       type: 'object',
       properties: {
@@ -108,7 +99,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
           },
           serverInfo: {
             name: 'excel-python-mcp',
-            version: '1.0.0'
+            version: '2.0.0'
           }
         }
       });
@@ -193,11 +184,10 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
             throw new Error(`File "${filename}" not found: ${oneDriveError.message}`);
           }
         } else {
-          const downloadResponse = await blockBlobClient.download();
-          if (!downloadResponse.readableStreamBody) {
-            throw new Error('Failed to download file from blob storage');
-          }
-          fileBuffer = await streamToBuffer(downloadResponse.readableStreamBody);
+          // Parallel ranged download - the workbook is sent to Python in full anyway
+          fileBuffer = await blockBlobClient.downloadToBuffer(0, undefined, {
+            concurrency: BLOB_DOWNLOAD_CONCURRENCY
+          });
           console.log(`✅ Downloaded from blob: ${(fileBuffer.length / 1024).toFixed(2)}KB`);
         }
       }
@@ -208,11 +198,12 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
 
       const pythonProcess = spawn('python3', [pythonServerPath]);
 
-      let stdoutData = '';
+      // Collect raw chunks and decode once: a multi-byte character may span two chunks
+      const stdoutChunks: Buffer[] = [];
       let stderrData = '';
 
-      pythonProcess.stdout.on('data', (data) => {
-        stdoutData += data.toString();
+      pythonProcess.stdout.on('data', (data: Buffer) => {
+        stdoutChunks.push(data);
       });
 
       pythonProcess.stderr.on('data', (data) => {
@@ -251,6 +242,7 @@ export default async function handler(req: NextApiRequest, res: NextApiResponse)
       });
 
       // Parse response
+      const stdoutData = Buffer.concat(stdoutChunks).toString('utf8');
       const lines = stdoutData.trim().split('\n');
       const lastLine = lines[lines.length - 1];
       const pythonResponse = JSON.parse(lastLine);
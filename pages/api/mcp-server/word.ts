@@ -1377,41 +1377,61 @@ async function addParagraph(args: any): Promise<string> {
   const { filename, text, alignment } = args;
   const docFilename = filename.endsWith('.docx') ? filename : `${filename}.docx`;
 
+  // Helper function to escape XML special characters in run text
+  function escapeXml(str: string): string {
+    return str
+      .replace(/&/g, '&amp;')
+      .replace(/</g, '&lt;')
+      .replace(/>/g, '&gt;')
+      .replace(/"/g, '&quot;');
+  }
+
   // OneDrive only - no blob fallback
   const buffer = await downloadFromOneDrive(docFilename);
 
-  // Parse existing document text
-  const mammoth = await import('mammoth');
-  const result = await mammoth.extractRawText({ buffer });
-  const existingText = result.value;
+  // Append-only edit: splice a <w:p> into document.xml instead of rebuilding the
+  // whole document, so existing content, styles and media are left untouched
+  const PizZip = (await import('pizzip')).default;
+  const zip = new PizZip(buffer);
 
-  // Create new document with existing text + new paragraph
-  const paragraphs = existingText.split('\n').map(line =>
-    new Paragraph({ children: [new TextRun(line || ' ')] })
-  );
+  const documentXml = zip.file('word/document.xml')?.asText();
+  if (!documentXml) {
+    throw new Error('Could not extract document.xml from .docx file');
+  }
 
-  // Add new paragraph with alignment
-  const alignmentMap: any = {
-    left: AlignmentType.LEFT,
-    center: AlignmentType.CENTER,
-    right: AlignmentType.RIGHT,
-    justify: AlignmentType.JUSTIFIED
-  };
+  const bodyEnd = documentXml.lastIndexOf('</w:body>');
+  if (bodyEnd === -1) {
+    throw new Error('Could not find document body in document.xml');
+  }
 
-  paragraphs.push(
-    new Paragraph({
-      children: [new TextRun(text)],
-      alignment: alignment ? alignmentMap[alignment] : AlignmentType.LEFT
+  // The body-level <w:sectPr> must stay the last child of <w:body>. It is the first
+  // <w:sectPr> after the last block-level element: section breaks inside paragraphs
+  // come earlier, and tracked changes nest another <w:sectPr> in <w:sectPrChange>
+  const lastBlockEnd = Math.max(
+    documentXml.indexOf('<w:body'),
+    ...['</w:p>', '</w:tbl>', '</w:sdt>'].map((tag) => {
+      const tagStart = documentXml.lastIndexOf(tag, bodyEnd);
+      return tagStart === -1 ? -1 : tagStart + tag.length;
     })
   );
+  const sectPrMatch = /<w:sectPr[\s>/]/.exec(documentXml.slice(lastBlockEnd, bodyEnd));
+  const insertAt = sectPrMatch ? lastBlockEnd + sectPrMatch.index : bodyEnd;
 
-  const doc = new Document({
-    sections: [{ children: paragraphs }]
-  });
+  // Word alignment values (justify is "both" in OOXML)
+  const alignmentMap: any = {
+    left: 'left',
+    center: 'center',
+    right: 'right',
+    justify: 'both'
+  };
+  const jc = alignment ? alignmentMap[alignment] : undefined;
+  const paragraphProps = jc ? `<w:pPr><w:jc w:val="${jc}"/></w:pPr>` : '';
+  const paragraphXml = `<w:p>${paragraphProps}<w:r><w:t xml:space="preserve">${escapeXml(text)}</w:t></w:r></w:p>`;
 
-  // Convert and upload
-  const { Packer } = await import('docx');
-  const newBuffer = await Packer.toBuffer(doc);
+  zip.file('word/document.xml', documentXml.slice(0, insertAt) + paragraphXml + documentXml.slice(insertAt));
+
+  // Generate new buffer (PizZip stores uncompressed unless DEFLATE is requested)
+  const newBuffer = Buffer.from(zip.generate({ type: 'nodebuffer', compression: 'DEFLATE' }));
 
   await updateOneDrive(docFilename, newBuffer);
   return `Added paragraph to ${docFilename} in OneDrive`;
@@ -1917,12 +1937,14 @@ async function mergeDocuments(args: any): Promise<string> {
 async function analyzeQuestionnaire(args: any): Promise<string> {
   const { filename } = args;
 
-  // First, read the document
-  const docContent = await readDocument({ filename });
+  // Read the document and the PowerNode config (selected model) concurrently -
+  // both are independent network round-trips (OneDrive and Table Storage)
+  const [docContent, config] = await Promise.all([
+    readDocument({ filename }),
+    getPowerNodeConfig()
+  ]);
   const parsedContent = JSON.parse(docContent);
 
-  // Get PowerNode config to use the selected model
-  const config = await getPowerNodeConfig();
   if (!config) {
     throw new Error('PowerNode configuration not found. Please configure your AI provider in /config');
   }
@@ -1957,12 +1979,13 @@ ${parsedContent.text}`
 async function extractData(args: any): Promise<string> {
   const { filename, prompt } = args;
 
-  // First, read the document
-  const docContent = await readDocument({ filename });
+  // Read the document and the PowerNode config (selected model) concurrently
+  const [docContent, config] = await Promise.all([
+    readDocument({ filename }),
+    getPowerNodeConfig()
+  ]);
   const parsedContent = JSON.parse(docContent);
 
-  // Get PowerNode config to use the selected model
-  const config = await getPowerNodeConfig();
   if (!config) {
     throw new Error('PowerNode configuration not found. Please configure your AI provider in /config');
   }